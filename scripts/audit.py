@@ -9,18 +9,36 @@ Implements check IDs defined in CLAUDE.md §9.5:
   SL-001  No plaintext secrets
   CC-001  Conventional Commits
   CB-001  No Combine
+  MB-001  Asset memory budget (Design-Doc §7.9.3)
 
 Usage:
-  python3 scripts/audit.py --staged   # Check staged files only
-  python3 scripts/audit.py --all      # Check entire repository
+  python3 scripts/audit.py --staged            # Check staged files only
+  python3 scripts/audit.py --all               # Check entire repository
+  python3 scripts/audit.py --changed-lines     # Check staged added lines only
+  python3 scripts/audit.py --all --jobs 4      # Scan with 4 worker processes
+  python3 scripts/audit.py --all --no-cache    # Bypass the .git/ result cache
+  python3 scripts/audit.py --all --format sarif  # Machine-readable output
+  python3 scripts/audit.py --all --profile     # Show slowest checks and files
 """
 
 import argparse
+import hashlib
+import json
+import os
+import re
+import struct
 import subprocess
 import sys
-from dataclasses import dataclass
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import List
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Pattern, Set, Tuple
+
+
+class AuditError(Exception):
+    """Raised when git output cannot be interpreted safely."""
 
 
 class Status(Enum):
@@ -39,35 +57,1226 @@ class CheckResult:
     status: Status
     file_count: int
     violations: List[str]
+    files_scanned: int = 0
+    bytes_read: int = 0
+    seconds: float = 0.0
+    shared_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class Rule:
+    """Content rule enforced by a single audit check.
+
+    Rules with a ``pattern`` are matched as a regex over raw bytes; rules
+    without one are token rules evaluated by SwiftAnalyzer. Hits on a
+    line carrying the ``waiver`` marker are ignored. Paths under any
+    ``exclude`` prefix are never scanned for this rule.
+    """
+
+    check_id: str
+    suffixes: Tuple[str, ...]
+    pattern: str = ""
+    exclude: Tuple[str, ...] = ()
+    waiver: str = ""
+
+    @property
+    def group(self) -> str:
+        """Regex group name identifying this rule in the combined matcher."""
+        return self.check_id.replace("-", "_")
+
+    def applies_to(self, path: str) -> bool:
+        """Return True if this rule should scan the given path."""
+        if not path.endswith(self.suffixes):
+            return False
+        return not any(path.startswith(prefix) for prefix in self.exclude)
+
+
+@dataclass
+class ScanResult:
+    """Violations collected by one pass over the file set, keyed by check ID."""
+
+    violations: Dict[str, List[str]] = field(default_factory=dict)
+    bytes_scanned: int = 0
+    bytes_skipped: int = 0
+    file_seconds: Dict[str, float] = field(default_factory=dict)
+    check_files: Dict[str, int] = field(default_factory=dict)
+    check_bytes: Dict[str, int] = field(default_factory=dict)
+    pass_seconds: Dict[Tuple[str, ...], float] = field(default_factory=dict)
+    # Index blob per path when contents were read from the index.
+    index: Optional[Dict[str, str]] = None
+
+    def for_check(self, check_id: str) -> List[str]:
+        """Return violations recorded for a check, in scan order."""
+        return self.violations.get(check_id, [])
+
+    def record_file(self, path: str, check_ids: List[str], result: "FileScan") -> None:
+        """Attribute one file's scan to the checks whose rules read it.
+
+        Pass times are accumulated per set of check IDs that ran in that
+        pass, since checks sharing a pass cannot be timed apart.
+        """
+        self.file_seconds[path] = self.file_seconds.get(path, 0.0) + result.seconds
+        for check_id in check_ids:
+            self.check_files[check_id] = self.check_files.get(check_id, 0) + 1
+            self.check_bytes[check_id] = (
+                self.check_bytes.get(check_id, 0) + result.scanned
+            )
+        for pass_ids, seconds in result.passes.items():
+            self.pass_seconds[pass_ids] = self.pass_seconds.get(pass_ids, 0.0) + seconds
+
+
+SECRET_SUFFIXES = (
+    ".swift",
+    ".md",
+    ".json",
+    ".yml",
+    ".yaml",
+    ".plist",
+    ".txt",
+    ".py",
+    ".sh",
+)
+
+SECRET_EXCLUDES = (".claude/", "docs/", "Design-Doc.md", "CLAUDE.md")
+
+RULES = [
+    Rule(
+        check_id="FU-001",
+        suffixes=(".swift",),
+        waiver="// APPLE-API-REQUIRED",
+    ),
+    Rule(
+        check_id="DA-001",
+        suffixes=(".swift",),
+        waiver="// DEBUG-ONLY",
+    ),
+    Rule(
+        check_id="DP-001",
+        pattern=(
+            r"\b(?:ObservableObject|PreviewProvider|UIApplicationDelegate"
+            r"|performSelector)\b|@(?:Published|StateObject|EnvironmentObject)\b"
+            r"|\bDispatchQueue\."
+        ),
+        suffixes=(".swift",),
+    ),
+    Rule(
+        check_id="SL-001",
+        pattern=r"https://discord(?:app)?\.com/api/webhooks/",
+        suffixes=SECRET_SUFFIXES,
+        exclude=SECRET_EXCLUDES,
+    ),
+    Rule(
+        check_id="CB-001",
+        suffixes=(".swift",),
+    ),
+]
+
+DEBUG_CALLS = {b"print", b"debugPrint", b"dump", b"NSLog"}
+
+# An added line can only hold a token-rule hit if it contains one of these.
+TOKEN_TRIGGER = re.compile(
+    rb"!|\b(?:" + b"|".join(sorted(DEBUG_CALLS | {b"Combine"})) + rb")\b"
+)
+
+# Keywords that may directly precede a prefix ``!`` (``return!done``).
+# ``as!`` and ``try!`` are forced operations and are still flagged.
+PREFIX_KEYWORDS = {
+    b"return",
+    b"throw",
+    b"in",
+    b"case",
+    b"where",
+    b"if",
+    b"guard",
+    b"while",
+    b"switch",
+    b"await",
+}
+
+# Declaration kinds allowed between ``import`` and the module name.
+IMPORT_KINDS = {
+    b"typealias",
+    b"struct",
+    b"class",
+    b"enum",
+    b"protocol",
+    b"let",
+    b"var",
+    b"func",
+}
+
+
+ASSET_CATALOG = "StarlightSync/Assets.xcassets/"
+
+# Decoded image budget from Design-Doc §7.9.3; nothing is evicted (§7.9.5).
+ASSET_MEMORY_BUDGET = 300 * 1024 * 1024
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Asset groups named in the single over-budget violation.
+ASSET_BREAKDOWN_TOP = 5
+
+Hits = Dict[str, List[Tuple[int, str]]]
+
+
+@dataclass
+class FileScan:
+    """Hits for one file plus the bytes scanned or skipped to produce them.
+
+    ``passes`` maps the check IDs evaluated together in one pass, the
+    regex matcher or the Swift analyzer, to that pass's time.
+    """
+
+    hits: Hits = field(default_factory=dict)
+    scanned: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+    passes: Dict[Tuple[str, ...], float] = field(default_factory=dict)
+
+
+PARALLEL_MIN_FILES = 256
+
+CHUNKS_PER_JOB = 4
+
+READ_BLOCK_SIZE = 1 << 20
+
+# Longest tail carried between blocks before a line is cut mid-way.
+MAX_CARRY_BYTES = READ_BLOCK_SIZE
+
+# Tokens held back on one line before SwiftAnalyzer cuts it mid-way.
+MAX_PENDING_TOKENS = 4096
+
+# Overlap kept when a long line is cut; longer than any match of the
+# bounded regex patterns in RULES.
+MAX_MATCH_BYTES = 1024
+
+# Same leading window git inspects when deciding a blob is binary.
+BINARY_SNIFF_BYTES = 8000
+
+PROFILE_TOP = 10
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+# Escapes git uses in C-quoted paths, besides three-digit octal bytes.
+C_ESCAPES = {
+    b"a": b"\a",
+    b"b": b"\b",
+    b"t": b"\t",
+    b"n": b"\n",
+    b"v": b"\v",
+    b"f": b"\f",
+    b"r": b"\r",
+    b'"': b'"',
+    b"\\": b"\\",
+}
+
+C_ESCAPE = re.compile(rb"\\([0-7]{3}|.)", re.DOTALL)
+
+# Splits "path:line: text" violations into a SARIF location.
+VIOLATION_LOCATION = re.compile(r"^(.+?):(\d+): ")
+
+CACHE_FILE = "audit-cache.json"
+
+
+@lru_cache(maxsize=None)
+def compile_matcher(rule_ids: Tuple[str, ...]) -> Pattern[bytes]:
+    """Compile the rules in ``rule_ids`` into one alternation of named groups.
+
+    Matchers are cached per rule subset, so every file of the same type
+    shares a single compiled pattern.
+    """
+    by_id = {rule.check_id: rule for rule in RULES}
+    alternation = "|".join(
+        f"(?P<{by_id[rid].group}>{by_id[rid].pattern})" for rid in rule_ids
+    )
+    return re.compile(alternation.encode(), re.MULTILINE)
+
+
+def rules_for(path: str) -> List[Rule]:
+    """Return the rules that apply to a path."""
+    return [rule for rule in RULES if rule.applies_to(path)]
+
+
+def line_text(content: bytes, offset: int, end: Optional[int] = None) -> str:
+    """Return the decoded line of ``content`` containing ``offset``."""
+    if end is None:
+        end = len(content)
+    line_start = content.rfind(b"\n", 0, offset) + 1
+    line_end = content.find(b"\n", offset, end)
+    if line_end == -1:
+        line_end = end
+    return content[line_start:line_end].decode("utf-8", errors="replace")
+
+
+SWIFT_TOKEN = re.compile(
+    rb"(?P<space>[ \t\r\f\v]+)"
+    rb"|(?P<newline>\n)"
+    rb"|(?P<comment>//[^\n]*)"
+    rb"|(?P<block>/\*)"
+    rb'|(?P<string>#*"(?:"")?)'
+    rb"|(?P<directive>#[A-Za-z_]+)"
+    rb"|(?P<identifier>[A-Za-z_\x80-\xff][A-Za-z0-9_\x80-\xff]*|`[^`\n]*`"
+    rb"|\$[A-Za-z0-9_]*)"
+    rb"|(?P<number>[0-9][0-9A-Za-z_]*)"
+    rb"|(?P<operator>\.(?:[=\-+!*%<>&|^~?.]|/(?![/*]))+"
+    rb"|(?:[=\-+!*%<>&|^~?]|/(?![/*]))+)"
+    rb"|(?P<punct>.)",
+    re.DOTALL,
+)
+
+BLOCK_COMMENT_DELIMITER = re.compile(rb"/\*|\*/")
+
+
+@lru_cache(maxsize=None)
+def string_delimiters(hashes: int, multiline: bool) -> Pattern[bytes]:
+    """Match the closing quote, escape or line end of a string literal."""
+    pounds = b"#" * hashes
+    close = re.escape((b'"""' if multiline else b'"') + pounds)
+    escape = re.escape(b"\\" + pounds)
+    stop = close if multiline else close + b"|\n"
+    return re.compile(escape + b"|" + stop)
+
+
+@dataclass
+class Token:
+    """One lexical token of Swift source."""
+
+    kind: str
+    text: bytes
+    line: int
+    start: int
+    spaced: bool
+
+
+@dataclass(frozen=True)
+class LexState:
+    """Where a cut buffer ends: inside a block comment or a string literal."""
+
+    kind: str
+    depth: int = 0
+    hashes: int = 0
+    multiline: bool = False
+
+
+class SwiftLexer:
+    """Linear-time Swift tokenizer over a byte buffer.
+
+    Emits identifier, operator, punctuation, number, string, comment and
+    directive tokens. Whitespace is folded into each token's ``spaced``
+    flag, and string interpolations are lexed as code. ``safe_end`` is
+    the offset just past the last newline outside any comment, string or
+    interpolation, where the buffer can be cut without splitting a token.
+
+    ``resume_at`` is the latest offset, outside interpolations, where
+    lexing can restart in ``resume_state``: before whitespace in code, or
+    inside an unterminated block comment or string literal. A lexer
+    created with ``state`` starts inside that comment or string.
+    """
+
+    def __init__(
+        self, buffer: bytes, first_line: int = 1, state: Optional[LexState] = None
+    ) -> None:
+        self.buffer = buffer
+        self.pos = 0
+        self.line = first_line
+        self.spaced = True
+        self.safe_end = 0
+        self.state = state
+        self.resume_at = 0
+        self.resume_state = state
+
+    def advance(self, end: int) -> None:
+        """Move past ``buffer[pos:end]``, counting the lines it spans."""
+        self.line += self.buffer.count(b"\n", self.pos, end)
+        self.pos = end
+
+    def emit(self, kind: str, end: int) -> Token:
+        """Build a token ending at ``end`` and move past it."""
+        token = Token(
+            kind, self.buffer[self.pos : end], self.line, self.pos, self.spaced
+        )
+        self.advance(end)
+        self.spaced = kind == "comment"
+        return token
+
+    def tokens(self, nested: bool = False) -> Iterator[Token]:
+        """Yield tokens until the buffer ends or a nested interpolation closes.
+
+        A nested call returns True when its interpolation closed.
+        """
+        buffer = self.buffer
+        depth = 0
+        if self.state is not None and not nested:
+            state, self.state = self.state, None
+            if state.kind == "comment":
+                yield self.block_comment(0, state.depth, nested)
+            else:
+                yield from self.string_body(0, state.hashes, state.multiline, nested, 0)
+        while self.pos < len(buffer):
+            match = SWIFT_TOKEN.match(buffer, self.pos)
+            assert match is not None
+            kind = match.lastgroup or "punct"
+            end = match.end()
+
+            if kind == "space":
+                if not nested:
+                    self.resume_at, self.resume_state = self.pos, None
+                self.pos = end
+                self.spaced = True
+            elif kind == "newline":
+                self.advance(end)
+                self.spaced = True
+                if not nested:
+                    self.safe_end = end
+                    self.resume_at, self.resume_state = end, None
+            elif kind == "block":
+                yield self.block_comment(end, 1, nested)
+            elif kind == "string":
+                yield from self.string(end, nested)
+            elif nested and kind == "punct" and match.group() == b")" and not depth:
+                self.pos = end
+                return True
+            else:
+                if nested and kind == "punct":
+                    depth += {b"(": 1, b")": -1}.get(match.group(), 0)
+                yield self.emit(kind, end)
+        return False
+
+    def block_comment(self, pos: int, depth: int, nested: bool) -> Token:
+        """Emit a possibly nested ``/* */`` comment whose body starts at ``pos``.
+
+        If the buffer ends first, the comment runs to the end and, outside
+        interpolations, a resume point inside it is recorded; a trailing
+        ``*`` or ``/`` is left for the next buffer in case it starts a
+        delimiter.
+        """
+        buffer = self.buffer
+        for match in BLOCK_COMMENT_DELIMITER.finditer(buffer, pos):
+            depth += 1 if match.group() == b"/*" else -1
+            pos = match.end()
+            if not depth:
+                return self.emit("comment", pos)
+        if not nested:
+            end = len(buffer)
+            partial = pos < end and buffer.endswith((b"*", b"/"))
+            self.resume_at = end - 1 if partial else end
+            self.resume_state = LexState("comment", depth=depth)
+        return self.emit("comment", len(buffer))
+
+    def string(self, opener_end: int, nested: bool) -> Iterator[Token]:
+        """Yield a string literal's segments and its interpolated code."""
+        opener = self.buffer[self.pos : opener_end]
+        yield from self.string_body(
+            opener_end,
+            opener.count(b"#"),
+            opener.endswith(b'"""'),
+            nested,
+            opener_end + 2,
+        )
+
+    def string_body(
+        self, pos: int, hashes: int, multiline: bool, nested: bool, settled: int
+    ) -> Iterator[Token]:
+        """Yield string segments from ``pos`` until the literal closes.
+
+        If the buffer ends inside the literal, outside interpolations, a
+        resume point is recorded far enough back that no delimiter or
+        escape is split, and no earlier than ``settled``, the offset by
+        which a fresh opener's ``\"\"\"`` form is known.
+        """
+        buffer = self.buffer
+        delimiters = string_delimiters(hashes, multiline)
+        while True:
+            match = delimiters.search(buffer, pos)
+            if match is not None and match.group() == b"\n":
+                pos = match.start()
+                break
+            if match is not None and not match.group().startswith(b"\\"):
+                pos = match.end()
+                break
+            if match is None or match.end() >= len(buffer):
+                if not nested:
+                    if match is None:
+                        resume = max(pos, len(buffer) - hashes - 4)
+                    else:
+                        resume = match.start()
+                    if resume >= settled:
+                        self.resume_at = resume
+                        self.resume_state = LexState(
+                            "string", hashes=hashes, multiline=multiline
+                        )
+                pos = len(buffer)
+                break
+            if buffer[match.end() : match.end() + 1] != b"(":
+                pos = match.end() + 1
+                continue
+            yield self.emit("string", match.end() + 1)
+            closed = yield from self.tokens(nested=True)
+            self.spaced = False
+            pos = self.pos
+            if not closed:
+                break
+        yield self.emit("string", pos)
+
+
+class SwiftAnalyzer:
+    """Evaluates Swift token rules (FU-001, DA-001, CB-001) over a file.
+
+    The file may arrive in several buffers; only tokens before each
+    buffer's ``safe_end`` are consumed, and rule state such as the
+    preceding tokens and the ``#if DEBUG`` stack carries across calls.
+    When the text after ``safe_end`` would exceed MAX_CARRY_BYTES, or
+    MAX_PENDING_TOKENS tokens wait on a long line, the buffer is cut at
+    the lexer's resume point instead and its comment or string state
+    carried, so both the carried tail and the pending tokens stay bounded.
+    """
+
+    def __init__(self, rules: List[Rule]) -> None:
+        self.rules = {rule.check_id: rule for rule in rules}
+        self.hits: Hits = {}
+        self.seen: Set[Tuple[str, int]] = set()
+        self.prev: Optional[Token] = None
+        self.prev2: Optional[Token] = None
+        self.prev3: Optional[Token] = None
+        self.debug_branches: List[bool] = []
+        self.awaiting_condition = False
+        self.state: Optional[LexState] = None
+
+    def feed(self, buffer: bytes, first_line: int, final: bool) -> int:
+        """Consume a buffer's complete tokens and return the cut offset."""
+        lexer = SwiftLexer(buffer, first_line, self.state)
+        pending: List[Token] = []
+        cut, state = 0, self.state
+        for token in lexer.tokens():
+            if lexer.safe_end > cut:
+                cut, state = lexer.safe_end, None
+                pending = self.flush(pending, cut, buffer)
+            elif len(pending) >= MAX_PENDING_TOKENS and lexer.resume_at > cut:
+                cut, state = lexer.resume_at, lexer.resume_state
+                pending = self.flush(pending, cut, buffer)
+            pending.append(token)
+
+        if final:
+            self.flush(pending, len(buffer), buffer)
+            self.state = None
+            return len(buffer)
+
+        if lexer.safe_end > cut:
+            cut, state = lexer.safe_end, None
+        elif len(buffer) - cut > MAX_CARRY_BYTES and lexer.resume_at > cut:
+            cut, state = lexer.resume_at, lexer.resume_state
+        self.flush(pending, cut, buffer)
+        self.state = state
+        return cut
+
+    def flush(self, pending: List[Token], cut: int, buffer: bytes) -> List[Token]:
+        """Visit pending tokens that start before ``cut``; return the rest."""
+        for index, token in enumerate(pending):
+            if token.start >= cut:
+                return pending[index:]
+            self.visit(token, buffer)
+        return []
+
+    def record(self, check_id: str, token: Token, buffer: bytes) -> None:
+        """Store a hit unless the rule is inactive, waived or already seen."""
+        rule = self.rules.get(check_id)
+        if rule is None or (check_id, token.line) in self.seen:
+            return
+        line = line_text(buffer, token.start)
+        if rule.waiver and rule.waiver in line:
+            return
+        self.seen.add((check_id, token.line))
+        self.hits.setdefault(check_id, []).append((token.line, line.strip()))
+
+    def visit(self, token: Token, buffer: bytes) -> None:
+        """Apply every token rule to the next significant token."""
+        if token.kind == "comment":
+            return
+        if token.kind == "directive":
+            self.visit_directive(token.text)
+        elif self.awaiting_condition:
+            self.awaiting_condition = False
+            if token.text == b"DEBUG" and self.debug_branches:
+                self.debug_branches[-1] = True
+
+        prev, prev2, prev3 = self.prev, self.prev2, self.prev3
+        if (
+            token.kind == "operator"
+            and token.text.startswith(b"!")
+            and not token.text.startswith(b"!=")
+            and not token.spaced
+            and prev is not None
+            and (
+                (prev.kind == "identifier" and prev.text not in PREFIX_KEYWORDS)
+                or prev.kind == "string"
+                or prev.text in (b")", b"]")
+                or (prev.kind == "number" and prev2 is not None and prev2.text == b".")
+            )
+        ):
+            self.record("FU-001", token, buffer)
+        elif (
+            token.text == b"("
+            and not token.spaced
+            and prev is not None
+            and prev.text in DEBUG_CALLS
+            and not self.is_member_call(prev2, prev3)
+            and not any(self.debug_branches)
+        ):
+            self.record("DA-001", prev, buffer)
+        elif token.text == b"Combine" and prev is not None:
+            if prev.text == b"import" or (
+                prev.text in IMPORT_KINDS
+                and prev2 is not None
+                and prev2.text == b"import"
+            ):
+                self.record("CB-001", token, buffer)
+
+        self.prev3, self.prev2, self.prev = prev2, prev, token
+
+    @staticmethod
+    def is_member_call(prev2: Optional[Token], prev3: Optional[Token]) -> bool:
+        """Return True if a debug call name is a method or a declaration.
+
+        ``Swift.print`` qualifies the free function, so it still counts.
+        """
+        if prev2 is None:
+            return False
+        if prev2.text == b".":
+            return prev3 is None or prev3.text != b"Swift"
+        return prev2.text == b"func"
+
+    def visit_directive(self, text: bytes) -> None:
+        """Track which ``#if`` branches are compiled only in DEBUG builds."""
+        if text == b"#if":
+            self.debug_branches.append(False)
+            self.awaiting_condition = True
+        elif not self.debug_branches:
+            return
+        elif text == b"#elseif":
+            self.debug_branches[-1] = False
+            self.awaiting_condition = True
+        elif text == b"#else":
+            self.debug_branches[-1] = False
+        elif text == b"#endif":
+            self.debug_branches.pop()
+
+
+def scan_content(
+    content: bytes,
+    rules: List[Rule],
+    end: Optional[int] = None,
+    first_line: int = 1,
+    begin: int = 0,
+    stop: Optional[int] = None,
+) -> Hits:
+    """Run the combined matcher for ``rules`` over ``content[begin:end]``.
+
+    Matches starting at or after ``stop`` are left for a later buffer.
+    Returns ``(line_no, line_text)`` pairs per check ID, numbered from
+    ``first_line`` at offset 0 and independent of the path so results
+    can be cached by blob.
+    """
+    if end is None:
+        end = len(content)
+    matcher = compile_matcher(tuple(rule.check_id for rule in rules))
+    by_group = {rule.group: rule for rule in rules}
+    found: Hits = {}
+    seen = set()
+    line_no = first_line
+    cursor = 0
+
+    for match in matcher.finditer(content, begin, end):
+        rule = by_group[match.lastgroup or ""]
+        start = match.start()
+        if stop is not None and start >= stop:
+            break
+        line_no += content.count(b"\n", cursor, start)
+        cursor = start
+        if (rule.check_id, line_no) in seen:
+            continue
+
+        line = line_text(content, start, end)
+        if rule.waiver and rule.waiver in line:
+            continue
+
+        seen.add((rule.check_id, line_no))
+        found.setdefault(rule.check_id, []).append((line_no, line.strip()))
+
+    return found
+
+
+def scan_blocks(blocks: Iterator[bytes], rules: List[Rule], size: int) -> FileScan:
+    """Scan a file block by block without holding it all in memory.
+
+    The regex and token passes each carry their own tail between blocks.
+    The regex tail runs from the last newline, so no line straddles a
+    boundary; past MAX_CARRY_BYTES the line is cut instead, keeping
+    MAX_MATCH_BYTES of overlap plus one byte of lookbehind. The token
+    tail is whatever SwiftAnalyzer leaves after its cut. Both tails stay
+    bounded, so peak memory does not grow with file or line length. A
+    NUL byte in the leading bytes marks the file as binary and ends the
+    scan. The regex and token passes are timed separately.
+    """
+    started = time.perf_counter()
+    result = FileScan()
+    pattern_rules = [rule for rule in rules if rule.pattern]
+    token_rules = [rule for rule in rules if not rule.pattern]
+    analyzer = SwiftAnalyzer(token_rules) if token_rules else None
+    pattern_seconds = token_seconds = 0.0
+    seen: Set[Tuple[str, int]] = set()
+    pattern_carry = token_carry = b""
+    pattern_line = token_line = 1
+    begin = 0
+
+    def add(found: Hits) -> None:
+        """Merge regex hits, dropping lines already reported by a cut line."""
+        for check_id, lines in found.items():
+            for line_no, text in lines:
+                if (check_id, line_no) not in seen:
+                    seen.add((check_id, line_no))
+                    result.hits.setdefault(check_id, []).append((line_no, text))
+
+    for block in blocks:
+        if not result.scanned and b"\0" in block[:BINARY_SNIFF_BYTES]:
+            return FileScan(skipped=size)
+        result.scanned += len(block)
+
+        if analyzer:
+            tick = time.perf_counter()
+            buffer = token_carry + block
+            cut = analyzer.feed(buffer, token_line, final=False)
+            token_line += buffer.count(b"\n", 0, cut)
+            token_carry = buffer[cut:]
+            token_seconds += time.perf_counter() - tick
+
+        if pattern_rules:
+            tick = time.perf_counter()
+            buffer = pattern_carry + block
+            cut = buffer.rfind(b"\n") + 1
+            if len(buffer) - cut <= MAX_CARRY_BYTES:
+                if cut:
+                    add(scan_content(buffer, pattern_rules, cut, pattern_line, begin))
+                    begin = 0
+            else:
+                stop = len(buffer) - MAX_MATCH_BYTES
+                add(
+                    scan_content(buffer, pattern_rules, None, pattern_line, begin, stop)
+                )
+                cut, begin = stop - 1, 1
+            pattern_line += buffer.count(b"\n", 0, cut)
+            pattern_carry = buffer[cut:]
+            pattern_seconds += time.perf_counter() - tick
+
+    if analyzer:
+        tick = time.perf_counter()
+        if token_carry:
+            analyzer.feed(token_carry, token_line, final=True)
+        merge_hits(result.hits, analyzer.hits)
+        result.passes[tuple(rule.check_id for rule in token_rules)] = (
+            time.perf_counter() - tick + token_seconds
+        )
+    if pattern_rules:
+        tick = time.perf_counter()
+        if pattern_carry:
+            add(scan_content(pattern_carry, pattern_rules, None, pattern_line, begin))
+        result.passes[tuple(rule.check_id for rule in pattern_rules)] = (
+            time.perf_counter() - tick + pattern_seconds
+        )
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def merge_hits(into: Hits, found: Hits) -> None:
+    """Append ``found`` hits onto ``into`` per check ID."""
+    for check_id, lines in found.items():
+        into.setdefault(check_id, []).extend(lines)
+
+
+def scan_path(path: str) -> FileScan:
+    """Scan one working-tree file, skipping it if binary."""
+    try:
+        size = os.stat(path).st_size
+    except OSError:
+        return FileScan()
+    rules = rules_for(path)
+    if not rules:
+        return FileScan(skipped=size)
+    try:
+        with open(path, "rb") as handle:
+            blocks = iter(lambda: handle.read(READ_BLOCK_SIZE), b"")
+            return scan_blocks(blocks, rules, size)
+    except OSError:
+        return FileScan()
+
+
+def scan_chunk(paths: List[str]) -> List[FileScan]:
+    """Scan a contiguous run of paths, returning per-file results in order.
+
+    Top-level so it can be pickled into ProcessPoolExecutor workers.
+    """
+    return [scan_path(path) for path in paths]
+
+
+def split_chunks(files: List[str], jobs: int) -> List[List[str]]:
+    """Split files into contiguous chunks, a few per worker for balance."""
+    size = max(1, -(-len(files) // (jobs * CHUNKS_PER_JOB)))
+    return [files[i : i + size] for i in range(0, len(files), size)]
+
+
+def scan_paths(files: List[str], jobs: int) -> List[FileScan]:
+    """Scan files inline or across a process pool, preserving order."""
+    if jobs > 1 and len(files) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            chunks = pool.map(scan_chunk, split_chunks(files, jobs))
+            return [result for chunk in chunks for result in chunk]
+    return scan_chunk(files)
+
+
+def ruleset_digest() -> str:
+    """Hash this script so any rule or scanner change invalidates the cache.
+
+    Token rules live in code (SwiftAnalyzer, DEBUG_CALLS, IMPORT_KINDS)
+    rather than in RULES, so the whole source is hashed, not just RULES.
+    """
+    with open(os.path.abspath(__file__), "rb") as handle:
+        return hashlib.sha256(handle.read()).hexdigest()
+
+
+def get_index_blobs() -> Dict[str, str]:
+    """Map every stage-0 index path to its blob SHA."""
+    result = subprocess.run(
+        ["git", "ls-files", "-s", "-z"],
+        capture_output=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        return {}
+
+    blobs: Dict[str, str] = {}
+    for entry in result.stdout.decode("utf-8", errors="replace").split("\0"):
+        if not entry:
+            continue
+        meta, path = entry.split("\t", 1)
+        _, sha, stage = meta.split()
+        if stage == "0":
+            blobs[path] = sha
+    return blobs
+
+
+def get_dirty_paths() -> Set[str]:
+    """Return tracked paths whose working tree differs from the index."""
+    result = subprocess.run(
+        ["git", "diff-files", "--name-only", "-z"],
+        capture_output=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        return set()
+    return {p for p in result.stdout.decode("utf-8", errors="replace").split("\0") if p}
+
+
+class BlobReader:
+    """Streams blob contents through one long-lived ``git cat-file --batch``.
+
+    Unread bytes of the current blob are discarded before the next one is
+    requested, so callers may stop reading a blob at any point.
+    """
+
+    def __init__(self) -> None:
+        self.proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        self.remaining = 0
+
+    def __enter__(self) -> "BlobReader":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def open(self, sha: str) -> Optional[int]:
+        """Request a blob and return its size, or None if git cannot find it."""
+        assert self.proc.stdin is not None and self.proc.stdout is not None
+        self.discard()
+        self.proc.stdin.write(sha.encode() + b"\n")
+        self.proc.stdin.flush()
+        header = self.proc.stdout.readline().split()
+        if len(header) != 3 or header[1] != b"blob":
+            return None
+        size = int(header[2])
+        self.remaining = size + 1
+        return size
+
+    def blocks(self) -> Iterator[bytes]:
+        """Yield the opened blob's contents in READ_BLOCK_SIZE pieces."""
+        assert self.proc.stdout is not None
+        while self.remaining > 1:
+            block = self.proc.stdout.read(min(READ_BLOCK_SIZE, self.remaining - 1))
+            if not block:
+                self.remaining = 0
+                return
+            self.remaining -= len(block)
+            yield block
+
+    def read(self, count: int) -> bytes:
+        """Return up to ``count`` leading bytes of the opened blob."""
+        assert self.proc.stdout is not None
+        data = self.proc.stdout.read(min(count, max(self.remaining - 1, 0)))
+        self.remaining -= len(data)
+        return data
+
+    def discard(self) -> None:
+        """Drain whatever is left of the opened blob, including its newline."""
+        assert self.proc.stdout is not None
+        while self.remaining > 0:
+            block = self.proc.stdout.read(min(READ_BLOCK_SIZE, self.remaining))
+            if not block:
+                break
+            self.remaining -= len(block)
+        self.remaining = 0
+
+    def close(self) -> None:
+        """Shut down the cat-file process."""
+        self.discard()
+        if self.proc.stdin is not None:
+            self.proc.stdin.close()
+        self.proc.wait()
+
+
+def scan_index(files: List[str], index: Dict[str, str]) -> List[FileScan]:
+    """Scan the index versions of files, streamed from a single cat-file.
+
+    Files no rule applies to are sized from the working tree, since
+    streaming their blobs just to measure them would defeat the skip.
+    """
+    results: List[FileScan] = []
+    with BlobReader() as reader:
+        for path in files:
+            sha = index.get(path)
+            if sha is None or not rules_for(path):
+                results.append(scan_path(path))
+                continue
+            size = reader.open(sha)
+            if size is None:
+                results.append(FileScan())
+            else:
+                results.append(scan_blocks(reader.blocks(), rules_for(path), size))
+    return results
+
+
+class ScanCache:
+    """Per-blob scan results persisted between runs under ``.git/``.
+
+    Entries are keyed by git blob SHA plus the IDs of the rules applied,
+    and the whole file is discarded when the auditor source digest changes.
+    Entries for blobs no longer in the index are evicted on save.
+    """
+
+    def __init__(self, path: str, blob_ids: Dict[str, str], live: Set[str]) -> None:
+        self.path = path
+        self.blob_ids = blob_ids
+        self.live = live
+        self.digest = ruleset_digest()
+        self.entries: Dict[str, Hits] = {}
+        self.changed = False
+        self.load()
+
+    @classmethod
+    def open(cls, blob_ids: Dict[str, str], live: Set[str]) -> Optional["ScanCache"]:
+        """Return the repository's cache, or None outside a git work tree."""
+        result = subprocess.run(
+            ["git", "rev-parse", "--git-path", CACHE_FILE],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            return None
+        return cls(result.stdout.strip(), blob_ids, live)
+
+    def load(self) -> None:
+        """Read cached entries if they were built with the current rules."""
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("rules") == self.digest:
+            self.entries = data.get("entries", {})
+
+    def key(self, path: str) -> Optional[str]:
+        """Return the cache key for a path, or None if it is uncacheable."""
+        blob = self.blob_ids.get(path)
+        rules = rules_for(path)
+        if blob is None or not rules:
+            return None
+        return blob + ":" + ",".join(rule.check_id for rule in rules)
+
+    def get(self, path: str) -> Optional[Hits]:
+        """Return cached hits for a path, or None on a miss."""
+        key = self.key(path)
+        if key is None or key not in self.entries:
+            return None
+        return {
+            check_id: [(line_no, text) for line_no, text in found]
+            for check_id, found in self.entries[key].items()
+        }
+
+    def put(self, path: str, hits: Hits) -> None:
+        """Record hits for a path if it has a stable blob ID."""
+        key = self.key(path)
+        if key is not None:
+            self.entries[key] = hits
+            self.changed = True
+
+    def save(self) -> None:
+        """Evict dead blobs and write the cache atomically."""
+        alive = {
+            key: hits
+            for key, hits in self.entries.items()
+            if key.split(":", 1)[0] in self.live
+        }
+        if not self.changed and len(alive) == len(self.entries):
+            return
+
+        payload = {"rules": self.digest, "entries": alive}
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            return
+
+
+def scan_files(
+    files: List[str],
+    jobs: int = 1,
+    cache: Optional[ScanCache] = None,
+    index: Optional[Dict[str, str]] = None,
+) -> ScanResult:
+    """Read each file once and route pattern hits to their checks.
+
+    Files with a cached result for their current blob are not read. The
+    rest are scanned, across a process pool when ``jobs`` > 1 and there
+    are enough of them. When ``index`` is given, contents come from those
+    index blobs rather than the working tree. Violations always come out
+    in ``files`` order, exactly as an uncached serial scan would produce.
+    """
+    per_file: Dict[str, Hits] = {}
+    pending: List[str] = []
+    for path in files:
+        cached = cache.get(path) if cache else None
+        if cached is None:
+            pending.append(path)
+        else:
+            per_file[path] = cached
+
+    scan = ScanResult()
+    if index is None:
+        scanned = scan_paths(pending, jobs)
+    else:
+        scanned = scan_index(pending, index)
+    for path, result in zip(pending, scanned):
+        per_file[path] = result.hits
+        scan.bytes_scanned += result.scanned
+        scan.bytes_skipped += result.skipped
+        if result.scanned:
+            check_ids = [rule.check_id for rule in rules_for(path)]
+            scan.record_file(path, check_ids, result)
+        if cache:
+            cache.put(path, result.hits)
+    if cache:
+        cache.save()
+
+    for path in files:
+        for check_id, found in per_file[path].items():
+            scan.violations.setdefault(check_id, []).extend(
+                f"{path}:{line_no}: {text}" for line_no, text in found
+            )
+    return scan
+
+
+def scan_added_lines(
+    files: List[str],
+    added: Dict[str, List[Tuple[int, bytes]]],
+    index: Dict[str, str],
+) -> ScanResult:
+    """Check staged added lines at a cost that follows the diff.
+
+    Regex rules match within one line, so they run over the added lines
+    alone. Token rules need the whole file for context (comments,
+    strings, ``#if DEBUG``), so a staged blob is lexed only when one of
+    its added lines contains a TOKEN_TRIGGER, and only hits on added
+    lines are kept.
+    """
+    scan = ScanResult()
+    with BlobReader() as reader:
+        for path in files:
+            rules = rules_for(path)
+            lines = added.get(path)
+            if not rules or not lines:
+                continue
+            numbers = [line_no for line_no, _ in lines]
+            pattern_rules = [rule for rule in rules if rule.pattern]
+            token_rules = [rule for rule in rules if not rule.pattern]
+            parts: List[Tuple[List[Rule], FileScan]] = []
+
+            if pattern_rules:
+                content = b"\n".join(text for _, text in lines)
+                part = scan_blocks(iter([content]), pattern_rules, len(content))
+                part.hits = {
+                    check_id: [(numbers[offset - 1], text) for offset, text in found]
+                    for check_id, found in part.hits.items()
+                }
+                parts.append((pattern_rules, part))
+
+            sha = index.get(path)
+            if (
+                token_rules
+                and sha is not None
+                and any(TOKEN_TRIGGER.search(text) for _, text in lines)
+            ):
+                size = reader.open(sha)
+                if size is not None:
+                    part = scan_blocks(reader.blocks(), token_rules, size)
+                    keep = set(numbers)
+                    part.hits = {
+                        check_id: [hit for hit in found if hit[0] in keep]
+                        for check_id, found in part.hits.items()
+                    }
+                    parts.append((token_rules, part))
+
+            for used, part in parts:
+                scan.bytes_scanned += part.scanned
+                scan.bytes_skipped += part.skipped
+                if part.scanned:
+                    scan.record_file(path, [rule.check_id for rule in used], part)
+                for check_id, found in part.hits.items():
+                    scan.violations.setdefault(check_id, []).extend(
+                        f"{path}:{line_no}: {text}" for line_no, text in found
+                    )
+    return scan
+
+
+def make_result(
+    check_id: str, name: str, files: List[str], violations: List[str]
+) -> CheckResult:
+    """Build a CheckResult whose status follows from its violations."""
+    return CheckResult(
+        check_id=check_id,
+        name=name,
+        status=Status.FAIL if violations else Status.PASS,
+        file_count=len(files),
+        violations=violations,
+    )
 
 
 def get_staged_files() -> List[str]:
-    """Return file paths staged for commit."""
+    """Return file paths staged for commit.
+
+    Their contents are read from the index, not the working tree, so
+    unstaged edits never leak into a pre-commit audit.
+    """
     result = subprocess.run(
-        ["git", "diff", "--cached", "--name-only", "--diff-filter=ACMR"],
+        ["git", "diff", "--cached", "--name-only", "--diff-filter=ACMR", "-z"],
         capture_output=True,
         text=True,
         check=False,
     )
     if result.returncode != 0:
         return []
-    return [f for f in result.stdout.strip().split("\n") if f]
+    return [f for f in result.stdout.split("\0") if f]
 
 
 def get_all_files() -> List[str]:
     """Return all tracked file paths in the repository."""
     result = subprocess.run(
-        ["git", "ls-files"],
+        ["git", "ls-files", "-z"],
         capture_output=True,
         text=True,
         check=False,
     )
     if result.returncode != 0:
         return []
-    return [f for f in result.stdout.strip().split("\n") if f]
+    return [f for f in result.stdout.split("\0") if f]
+
+
+def unquote_path(raw: bytes) -> bytes:
+    """Undo git's C-style quoting of a diff header path, if present.
+
+    Unquoted names containing a space carry a trailing tab, also removed.
+    """
+    if not raw.startswith(b'"'):
+        return raw[:-1] if raw.endswith(b"\t") else raw
+    if len(raw) < 2 or not raw.endswith(b'"'):
+        raise AuditError(f"malformed quoted path in diff: {raw!r}")
+
+    def unescape(match: "re.Match[bytes]") -> bytes:
+        code = match.group(1)
+        if len(code) == 3:
+            return bytes([int(code, 8)])
+        if code not in C_ESCAPES:
+            raise AuditError(f"unknown escape in diff path: {raw!r}")
+        return C_ESCAPES[code]
 
+    return C_ESCAPE.sub(unescape, raw[1:-1])
 
-def check_pz001(files: List[str]) -> CheckResult:
+
+def get_added_lines() -> Dict[str, List[Tuple[int, bytes]]]:
+    """Parse ``git diff --cached -U0`` into added lines per staged path.
+
+    Each added line is paired with its line number in the staged file.
+    Prefixes and path quoting are pinned on the command line so user diff
+    settings cannot change the headers; a ``+++`` header that still
+    cannot be parsed raises AuditError rather than dropping the file.
+    """
+    result = subprocess.run(
+        [
+            "git",
+            "-c",
+            "core.quotePath=false",
+            "diff",
+            "--cached",
+            "-U0",
+            "--diff-filter=ACMR",
+            "--no-color",
+            "--no-ext-diff",
+            "--src-prefix=a/",
+            "--dst-prefix=b/",
+        ],
+        capture_output=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        return {}
+
+    added: Dict[str, List[Tuple[int, bytes]]] = {}
+    path = ""
+    line_no = 0
+    in_header = False
+    for raw in result.stdout.split(b"\n"):
+        if raw.startswith(b"diff --git "):
+            in_header = True
+            path = ""
+        elif in_header and raw.startswith(b"+++ "):
+            target = unquote_path(raw[4:])
+            if not target.startswith(b"b/"):
+                raise AuditError(f"unexpected diff header: {raw!r}")
+            path = target[2:].decode("utf-8", errors="replace")
+        elif raw.startswith(b"@@ "):
+            in_header = False
+            new_range = raw.split(b" ")[2]
+            line_no = int(new_range[1:].split(b",")[0])
+        elif not in_header and raw.startswith(b"+") and path:
+            added.setdefault(path, []).append((line_no, raw[1:]))
+            line_no += 1
+    return added
+
+
+def check_pz001(files: List[str], scan: ScanResult) -> CheckResult:
     """PZ-001: No AI attribution (CLAUDE.md §1)."""
     return CheckResult(
         check_id="PZ-001",
@@ -78,51 +1287,29 @@ def check_pz001(files: List[str]) -> CheckResult:
     )
 
 
-def check_fu001(files: List[str]) -> CheckResult:
+def check_fu001(files: List[str], scan: ScanResult) -> CheckResult:
     """FU-001: No force unwraps (CLAUDE.md §4.7)."""
-    return CheckResult(
-        check_id="FU-001",
-        name="No force unwraps",
-        status=Status.PASS,
-        file_count=len(files),
-        violations=[],
-    )
+    return make_result("FU-001", "No force unwraps", files, scan.for_check("FU-001"))
 
 
-def check_da001(files: List[str]) -> CheckResult:
+def check_da001(files: List[str], scan: ScanResult) -> CheckResult:
     """DA-001: No debug artifacts (CLAUDE.md §4.7)."""
-    return CheckResult(
-        check_id="DA-001",
-        name="No debug artifacts",
-        status=Status.PASS,
-        file_count=len(files),
-        violations=[],
-    )
+    return make_result("DA-001", "No debug artifacts", files, scan.for_check("DA-001"))
 
 
-def check_dp001(files: List[str]) -> CheckResult:
+def check_dp001(files: List[str], scan: ScanResult) -> CheckResult:
     """DP-001: No deprecated APIs (CLAUDE.md §3.1, §4.1-4.2)."""
-    return CheckResult(
-        check_id="DP-001",
-        name="No deprecated APIs",
-        status=Status.PASS,
-        file_count=len(files),
-        violations=[],
-    )
+    return make_result("DP-001", "No deprecated APIs", files, scan.for_check("DP-001"))
 
 
-def check_sl001(files: List[str]) -> CheckResult:
+def check_sl001(files: List[str], scan: ScanResult) -> CheckResult:
     """SL-001: No plaintext secrets (CLAUDE.md §5)."""
-    return CheckResult(
-        check_id="SL-001",
-        name="No plaintext secrets",
-        status=Status.PASS,
-        file_count=len(files),
-        violations=[],
+    return make_result(
+        "SL-001", "No plaintext secrets", files, scan.for_check("SL-001")
     )
 
 
-def check_cc001(files: List[str]) -> CheckResult:
+def check_cc001(files: List[str], scan: ScanResult) -> CheckResult:
     """CC-001: Conventional Commits (CLAUDE.md §9)."""
     return CheckResult(
         check_id="CC-001",
@@ -133,15 +1320,110 @@ def check_cc001(files: List[str]) -> CheckResult:
     )
 
 
-def check_cb001(files: List[str]) -> CheckResult:
+def check_cb001(files: List[str], scan: ScanResult) -> CheckResult:
     """CB-001: No Combine (CLAUDE.md §3.1)."""
-    return CheckResult(
-        check_id="CB-001",
-        name="No Combine",
-        status=Status.PASS,
-        file_count=len(files),
-        violations=[],
+    return make_result("CB-001", "No Combine", files, scan.for_check("CB-001"))
+
+
+def png_dimensions(header: bytes) -> Optional[Tuple[int, int]]:
+    """Read width and height from a PNG's IHDR chunk without decoding it."""
+    if len(header) < 24 or header[:8] != PNG_SIGNATURE or header[12:16] != b"IHDR":
+        return None
+    width, height = struct.unpack(">II", header[16:24])
+    return width, height
+
+
+def asset_group(path: str) -> str:
+    """Return the catalog-relative sprite atlas or imageset of a PNG."""
+    parts = path[len(ASSET_CATALOG) :].split("/")
+    for suffix in (".spriteatlas", ".imageset"):
+        for depth, part in enumerate(parts):
+            if part.endswith(suffix):
+                return "/".join(parts[: depth + 1])
+    return "/".join(parts)
+
+
+def catalog_png_headers(
+    paths: List[str], index: Optional[Dict[str, str]]
+) -> Iterator[Tuple[str, bytes]]:
+    """Yield each catalog PNG in ``paths`` with its leading 24 bytes.
+
+    Headers come from the index blobs when ``index`` is given, so staged
+    audits see staged images, and from the working tree otherwise.
+    """
+    pngs = sorted(
+        path
+        for path in paths
+        if path.startswith(ASSET_CATALOG) and path.endswith(".png")
     )
+    if index is not None:
+        with BlobReader() as reader:
+            for path in pngs:
+                size = reader.open(index[path])
+                yield path, b"" if size is None else reader.read(24)
+        return
+
+    for path in pngs:
+        try:
+            with open(path, "rb") as handle:
+                yield path, handle.read(24)
+        except OSError:
+            yield path, b""
+
+
+def measure_asset_memory(
+    paths: List[str], index: Optional[Dict[str, str]] = None
+) -> Tuple[Dict[str, int], List[str], int]:
+    """Sum decoded RGBA bytes per asset group across tracked catalog PNGs.
+
+    Every scale variant counts toward its group. Returns the per-group
+    totals, any PNGs whose header could not be read, and the PNG count.
+    """
+    totals: Dict[str, int] = {}
+    unreadable: List[str] = []
+    count = 0
+    for path, header in catalog_png_headers(paths, index):
+        count += 1
+        dimensions = png_dimensions(header)
+        if dimensions is None:
+            unreadable.append(path)
+            continue
+        group = asset_group(path)
+        totals[group] = totals.get(group, 0) + dimensions[0] * dimensions[1] * 4
+    return totals, unreadable, count
+
+
+def check_mb001(files: List[str], scan: ScanResult) -> CheckResult:
+    """MB-001: Asset memory budget (Design-Doc §7.9.3, §7.9.5).
+
+    Runs only when the audited files touch the asset catalog. Measures
+    every tracked catalog PNG: the index entries in staged modes, the
+    ``git ls-files`` set under --all. Reads each 24-byte PNG header,
+    from the index in staged modes, and never decodes pixel data.
+    """
+    if not any(path.startswith(ASSET_CATALOG) for path in files):
+        return make_result("MB-001", "Asset memory budget", [], [])
+
+    tracked = files if scan.index is None else list(scan.index)
+    totals, unreadable, count = measure_asset_memory(tracked, scan.index)
+    violations = [f"{path}: unreadable PNG header" for path in unreadable]
+    total = sum(totals.values())
+    if total > ASSET_MEMORY_BUDGET:
+        ranked = sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+        largest = ", ".join(
+            f"{group} {format_bytes(size)}"
+            for group, size in ranked[:ASSET_BREAKDOWN_TOP]
+        )
+        if len(ranked) > ASSET_BREAKDOWN_TOP:
+            largest += f", +{len(ranked) - ASSET_BREAKDOWN_TOP} more"
+        violations.append(
+            f"decoded images total {format_bytes(total)}, "
+            f"budget {format_bytes(ASSET_MEMORY_BUDGET)}; largest: {largest}"
+        )
+    result = make_result("MB-001", "Asset memory budget", files, violations)
+    result.files_scanned = count
+    result.bytes_read = count * 24
+    return result
 
 
 CHECKS = [
@@ -152,45 +1434,266 @@ CHECKS = [
     check_sl001,
     check_cc001,
     check_cb001,
+    check_mb001,
 ]
 
 
-def run_audit(mode: str) -> int:
-    """Execute all audit checks and report results."""
+def collect(mode: str, jobs: int, use_cache: bool) -> Tuple[List[str], ScanResult]:
+    """Resolve the file set for a mode and scan it."""
+    index = get_index_blobs()
+    if mode == "changed-lines":
+        files = get_staged_files()
+        scan = scan_added_lines(files, get_added_lines(), index)
+        scan.index = index
+        return files, scan
+
     if mode == "staged":
         files = get_staged_files()
+        blob_ids = index
     else:
         files = get_all_files()
+        dirty = get_dirty_paths()
+        blob_ids = {path: sha for path, sha in index.items() if path not in dirty}
+
+    cache = ScanCache.open(blob_ids, set(index.values())) if use_cache else None
+    staged_index = index if mode == "staged" else None
+    scan = scan_files(files, jobs, cache, staged_index)
+    scan.index = staged_index
+    return files, scan
+
+
+def format_bytes(count: int) -> str:
+    """Render a byte count with a binary unit suffix."""
+    size = float(count)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
 
+
+def run_checks(files: List[str], scan: ScanResult) -> List[CheckResult]:
+    """Run every registered check, attaching its scan metrics.
+
+    A check's ``seconds`` covers only work done for it alone; passes it
+    shared with other checks are reported whole as ``shared_seconds``.
+    """
     results: List[CheckResult] = []
     for check_fn in CHECKS:
-        results.append(check_fn(files))
+        started = time.perf_counter()
+        result = check_fn(files, scan)
+        result.seconds = time.perf_counter() - started
+        result.files_scanned += scan.check_files.get(result.check_id, 0)
+        result.bytes_read += scan.check_bytes.get(result.check_id, 0)
+        for pass_ids, seconds in scan.pass_seconds.items():
+            if pass_ids == (result.check_id,):
+                result.seconds += seconds
+            elif result.check_id in pass_ids:
+                result.shared_seconds += seconds
+        results.append(result)
+    return results
+
+
+def check_metrics(result: CheckResult) -> Dict[str, object]:
+    """Return the machine-readable metrics for one check."""
+    return {
+        "files_scanned": result.files_scanned,
+        "bytes_read": result.bytes_read,
+        "matches": len(result.violations),
+        "seconds": round(result.seconds, 6),
+        "shared_seconds": round(result.shared_seconds, 6),
+    }
 
-    has_failure = False
 
+def slowest_passes(scan: ScanResult) -> List[Tuple[str, float]]:
+    """Return the PROFILE_TOP scan passes by total time, named by check IDs."""
+    named = [("+".join(ids), seconds) for ids, seconds in scan.pass_seconds.items()]
+    ranked = sorted(named, key=lambda item: (-item[1], item[0]))
+    return ranked[:PROFILE_TOP]
+
+
+def slowest_files(scan: ScanResult) -> List[Tuple[str, float]]:
+    """Return the PROFILE_TOP files that took longest to scan."""
+    ranked = sorted(scan.file_seconds.items(), key=lambda item: (-item[1], item[0]))
+    return ranked[:PROFILE_TOP]
+
+
+def render_text(
+    mode: str,
+    files: List[str],
+    scan: ScanResult,
+    results: List[CheckResult],
+    profile: bool,
+) -> None:
+    """Write the human-readable audit banner to stdout."""
     sys.stdout.write("=" * 60 + "\n")
     sys.stdout.write("  AUDIT RESULTS\n")
     sys.stdout.write(f"  Mode: {mode} | Files: {len(files)}\n")
+    sys.stdout.write(
+        f"  Scanned: {format_bytes(scan.bytes_scanned)}"
+        f" | Skipped: {format_bytes(scan.bytes_skipped)}\n"
+    )
     sys.stdout.write("=" * 60 + "\n")
 
     for r in results:
         status_str = r.status.value
         sys.stdout.write(f"  [{status_str}]  {r.check_id}  {r.name}\n")
         if r.status == Status.FAIL:
-            has_failure = True
             for v in r.violations:
                 sys.stdout.write(f"           -> {v}\n")
 
     sys.stdout.write("=" * 60 + "\n")
 
-    if has_failure:
-        sys.stdout.write("  RESULT: FAIL\n")
+    if profile:
+        sys.stdout.write("  PROFILE: slowest checks (own time, shared passes)\n")
+        ranked = sorted(results, key=lambda item: (-item.seconds, -item.shared_seconds))
+        for r in ranked[:PROFILE_TOP]:
+            sys.stdout.write(
+                f"  {r.seconds * 1000:9.2f} ms  {r.check_id}"
+                f"  {r.files_scanned} files, {format_bytes(r.bytes_read)}"
+                f", +{r.shared_seconds * 1000:.2f} ms shared\n"
+            )
+        sys.stdout.write("  PROFILE: slowest passes\n")
+        for checks, seconds in slowest_passes(scan):
+            sys.stdout.write(f"  {seconds * 1000:9.2f} ms  {checks}\n")
+        sys.stdout.write("  PROFILE: slowest files\n")
+        for path, seconds in slowest_files(scan):
+            sys.stdout.write(f"  {seconds * 1000:9.2f} ms  {path}\n")
         sys.stdout.write("=" * 60 + "\n")
-        return 1
 
-    sys.stdout.write("  RESULT: PASS\n")
+    failed = any(r.status == Status.FAIL for r in results)
+    sys.stdout.write(f"  RESULT: {'FAIL' if failed else 'PASS'}\n")
     sys.stdout.write("=" * 60 + "\n")
-    return 0
+
+
+def render_json(
+    mode: str,
+    files: List[str],
+    scan: ScanResult,
+    results: List[CheckResult],
+    profile: bool,
+) -> None:
+    """Write results and per-check metrics as a JSON document."""
+    failed = any(r.status == Status.FAIL for r in results)
+    report: Dict[str, object] = {
+        "mode": mode,
+        "files": len(files),
+        "bytes_scanned": scan.bytes_scanned,
+        "bytes_skipped": scan.bytes_skipped,
+        "result": "FAIL" if failed else "PASS",
+        "checks": [
+            {
+                "check_id": r.check_id,
+                "name": r.name,
+                "status": r.status.value,
+                **check_metrics(r),
+                "violations": r.violations,
+            }
+            for r in results
+        ],
+    }
+    if profile:
+        report["slowest_passes"] = [
+            {"checks": checks.split("+"), "seconds": round(seconds, 6)}
+            for checks, seconds in slowest_passes(scan)
+        ]
+        report["slowest_files"] = [
+            {"path": path, "seconds": round(seconds, 6)}
+            for path, seconds in slowest_files(scan)
+        ]
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+def render_sarif(
+    mode: str,
+    files: List[str],
+    scan: ScanResult,
+    results: List[CheckResult],
+    profile: bool,
+) -> None:
+    """Write results as a SARIF 2.1.0 log, with metrics in property bags."""
+    sarif_results: List[Dict[str, object]] = []
+    for r in results:
+        for violation in r.violations:
+            entry: Dict[str, object] = {
+                "ruleId": r.check_id,
+                "level": "error",
+                "message": {"text": violation},
+            }
+            location = VIOLATION_LOCATION.match(violation)
+            if location:
+                entry["locations"] = [
+                    {
+                        "physicalLocation": {
+                            "artifactLocation": {"uri": location.group(1)},
+                            "region": {"startLine": int(location.group(2))},
+                        }
+                    }
+                ]
+            sarif_results.append(entry)
+
+    properties: Dict[str, object] = {
+        "mode": mode,
+        "files": len(files),
+        "bytes_scanned": scan.bytes_scanned,
+        "bytes_skipped": scan.bytes_skipped,
+    }
+    if profile:
+        properties["slowest_passes"] = [
+            {"checks": checks.split("+"), "seconds": round(seconds, 6)}
+            for checks, seconds in slowest_passes(scan)
+        ]
+        properties["slowest_files"] = [
+            {"path": path, "seconds": round(seconds, 6)}
+            for path, seconds in slowest_files(scan)
+        ]
+    log = {
+        "$schema": SARIF_SCHEMA,
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": {
+                    "driver": {
+                        "name": "audit",
+                        "rules": [
+                            {
+                                "id": r.check_id,
+                                "shortDescription": {"text": r.name},
+                                "properties": check_metrics(r),
+                            }
+                            for r in results
+                        ],
+                    }
+                },
+                "results": sarif_results,
+                "properties": properties,
+            }
+        ],
+    }
+    json.dump(log, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+RENDERERS = {
+    "text": render_text,
+    "json": render_json,
+    "sarif": render_sarif,
+}
+
+
+def run_audit(
+    mode: str,
+    jobs: int = 1,
+    use_cache: bool = True,
+    output: str = "text",
+    profile: bool = False,
+) -> int:
+    """Execute all audit checks and report results."""
+    files, scan = collect(mode, jobs, use_cache)
+    results = run_checks(files, scan)
+    RENDERERS[output](mode, files, scan, results, profile)
+    return 1 if any(r.status == Status.FAIL for r in results) else 0
 
 
 def main() -> None:
@@ -209,10 +1712,48 @@ def main() -> None:
         action="store_true",
         help="Audit entire repository",
     )
+    group.add_argument(
+        "--changed-lines",
+        action="store_true",
+        help="Audit only lines added by staged changes",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        metavar="N",
+        help="Worker processes for file scanning (default: CPU count)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and do not update the per-blob result cache",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(RENDERERS),
+        default="text",
+        help="Output format (default: text)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Report the slowest checks and files",
+    )
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
-    mode = "staged" if args.staged else "all"
-    sys.exit(run_audit(mode))
+    if args.changed_lines:
+        mode = "changed-lines"
+    else:
+        mode = "staged" if args.staged else "all"
+    try:
+        code = run_audit(mode, args.jobs, not args.no_cache, args.format, args.profile)
+    except AuditError as exc:
+        sys.stderr.write(f"audit: {exc}\n")
+        code = 2
+    sys.exit(code)
 
 
 if __name__ == "__main__":
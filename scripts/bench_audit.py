@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""Benchmark harness for the governance auditor (scripts/audit.py).
+
+Generates synthetic git repositories of Swift, Markdown and binary files
+at a controlled violation density, then times audit.py in --all and
+--staged modes with a cold and a warm result cache. Each measurement runs
+audit.py as a child process, so wall time matches what the pre-commit
+hook pays and peak RSS is isolated per run.
+
+MB/s is measured over the audited corpus, the text files in the run's
+file set, so warm runs stay comparable even though they scan almost
+nothing; bytes actually scanned are reported alongside. Content is
+derived from a fixed seed, so results are comparable across runs; pass
+a previous --output file to --compare to see the deltas.
+
+Usage:
+  python3 scripts/bench_audit.py                        # 1k, 10k, 100k files
+  python3 scripts/bench_audit.py --sizes 1000 --repeat 5
+  python3 scripts/bench_audit.py --output bench.json
+  python3 scripts/bench_audit.py --compare bench.json   # Diff against baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Tuple
+
+AUDIT_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "audit.py")
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+TABLE_WIDTH = 84
+
+# Share of generated files per kind; the remainder is binary.
+SWIFT_SHARE = 0.6
+MARKDOWN_SHARE = 0.25
+
+GIT_IDENTITY = ["-c", "user.name=bench", "-c", "user.email=bench@localhost"]
+
+# Assembled at runtime so this file never trips SL-001 itself.
+WEBHOOK_URL = "https://discord" + ".com/api/webhooks/0/bench"
+
+SWIFT_LINES = [
+    "    let value = items.first ?? fallback",
+    "    guard let player = audioPlayer else { return }",
+    '    let label = "Score: \\(score)"',
+    "    if isActive && !isPaused { advance() }",
+    "    // Keeps the chapter transition under the frame budget.",
+    "    let offset = CGFloat(index) * spacing",
+    "    try? engine.start()",
+    "    state = lhs != rhs ? .changed : .idle",
+]
+
+SWIFT_VIOLATIONS = [
+    "    let texture = atlas.textureNamed(name)!",
+    '    print("debug: \\(state)")',
+    "    DispatchQueue.main.async { refresh() }",
+    f'    let hook = "{WEBHOOK_URL}"',
+]
+
+MARKDOWN_LINES = [
+    "The chapter preloads every asset before the handshake completes.",
+    "- Audio buffers are prepared once and reused between chapters.",
+    "See the design document for the memory budget.",
+    "",
+]
+
+MARKDOWN_VIOLATIONS = [f"Webhook: {WEBHOOK_URL}"]
+
+
+@dataclass
+class Measurement:
+    """Timing and resource usage for one audit configuration."""
+
+    files: int
+    mode: str
+    cache: str
+    seconds: float
+    files_audited: int
+    corpus_bytes: int
+    bytes_scanned: int
+    mb_per_second: float
+    files_per_second: float
+    peak_rss_mb: float
+
+    @property
+    def key(self) -> str:
+        """Identify the configuration independently of its results."""
+        return f"{self.files}/{self.mode}/{self.cache}"
+
+
+def swift_file(rng: random.Random, index: int, dirty: bool) -> str:
+    """Return a synthetic Swift source, with one violation if ``dirty``."""
+    body = [rng.choice(SWIFT_LINES) for _ in range(rng.randint(20, 120))]
+    if dirty:
+        body.insert(rng.randrange(len(body)), rng.choice(SWIFT_VIOLATIONS))
+    lines = [
+        "import SwiftUI",
+        "",
+        f"struct Generated{index}View: View {{",
+        "  func update() {",
+        *body,
+        "  }",
+        "}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def markdown_file(rng: random.Random, index: int, dirty: bool) -> str:
+    """Return a synthetic Markdown document, with one violation if ``dirty``."""
+    body = [rng.choice(MARKDOWN_LINES) for _ in range(rng.randint(10, 80))]
+    if dirty:
+        body.insert(rng.randrange(len(body)), rng.choice(MARKDOWN_VIOLATIONS))
+    return f"# Note {index}\n\n" + "\n".join(body) + "\n"
+
+
+def binary_file(rng: random.Random) -> bytes:
+    """Return a PNG-signed blob of random bytes."""
+    size = rng.randint(4 * 1024, 64 * 1024)
+    return b"\x89PNG\r\n\x1a\n" + rng.randbytes(size)
+
+
+def git(repo: str, *args: str) -> None:
+    """Run a git command inside ``repo``, failing loudly."""
+    subprocess.run(
+        ["git", *GIT_IDENTITY, *args],
+        cwd=repo,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def generate_repo(root: str, count: int, density: float, seed: int) -> List[str]:
+    """Create and commit a synthetic repository; return its text file paths."""
+    rng = random.Random(seed)
+    os.makedirs(root)
+    git(root, "init", "-q")
+    text_paths: List[str] = []
+
+    for index in range(count):
+        folder = os.path.join(root, f"Module{index // 500:03d}")
+        os.makedirs(folder, exist_ok=True)
+        roll = rng.random()
+        dirty = rng.random() < density
+        if roll < SWIFT_SHARE:
+            path = os.path.join(folder, f"File{index}.swift")
+            data = swift_file(rng, index, dirty).encode()
+        elif roll < SWIFT_SHARE + MARKDOWN_SHARE:
+            path = os.path.join(folder, f"Note{index}.md")
+            data = markdown_file(rng, index, dirty).encode()
+        else:
+            path = os.path.join(folder, f"img_{index}.png")
+            data = binary_file(rng)
+        with open(path, "wb") as handle:
+            handle.write(data)
+        if not path.endswith(".png"):
+            text_paths.append(os.path.relpath(path, root))
+
+    git(root, "add", "-A")
+    git(root, "commit", "-q", "-m", "Synthetic baseline")
+    return text_paths
+
+
+def stage_edits(
+    root: str, text_paths: List[str], fraction: float, density: float, seed: int
+) -> List[str]:
+    """Append a line to a fraction of text files, stage and return them."""
+    rng = random.Random(seed + 1)
+    chosen = rng.sample(text_paths, max(1, int(len(text_paths) * fraction)))
+    for relpath in chosen:
+        if rng.random() < density:
+            line = rng.choice(SWIFT_VIOLATIONS)
+        else:
+            line = rng.choice(SWIFT_LINES)
+        with open(os.path.join(root, relpath), "a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+    git(root, "add", "--", *chosen)
+    return chosen
+
+
+def corpus_size(root: str, paths: List[str]) -> int:
+    """Return the total size in bytes of ``paths`` under ``root``."""
+    return sum(os.path.getsize(os.path.join(root, path)) for path in paths)
+
+
+def clear_cache(root: str) -> None:
+    """Remove the auditor's result cache from a repository."""
+    try:
+        os.remove(os.path.join(root, ".git", "audit-cache.json"))
+    except FileNotFoundError:
+        pass
+
+
+def run_once(root: str, mode: str, jobs: Optional[int]) -> Tuple[float, float, Dict]:
+    """Run audit.py once; return wall seconds, peak RSS in MB and its report."""
+    command = [sys.executable, AUDIT_SCRIPT, f"--{mode}", "--format", "json"]
+    if jobs is not None:
+        command += ["--jobs", str(jobs)]
+
+    started = time.perf_counter()
+    proc = subprocess.Popen(command, cwd=root, stdout=subprocess.PIPE)
+    assert proc.stdout is not None
+    output = proc.stdout.read()
+    _, status, usage = os.wait4(proc.pid, 0)
+    seconds = time.perf_counter() - started
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode not in (0, 1):
+        raise RuntimeError(f"audit.py exited with {proc.returncode}")
+
+    # ru_maxrss is kilobytes on Linux and bytes on macOS.
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return seconds, usage.ru_maxrss / scale, json.loads(output)
+
+
+def measure(
+    root: str,
+    files: int,
+    mode: str,
+    cold: bool,
+    corpus: int,
+    repeat: int,
+    jobs: Optional[int],
+) -> Measurement:
+    """Time one configuration, reporting the median of ``repeat`` runs.
+
+    ``corpus`` is the byte size of the text files the mode audits.
+    """
+    if not cold:
+        clear_cache(root)
+        run_once(root, mode, jobs)
+
+    timings: List[float] = []
+    peak_rss = 0.0
+    report: Dict = {}
+    for _ in range(repeat):
+        if cold:
+            clear_cache(root)
+        seconds, rss, report = run_once(root, mode, jobs)
+        timings.append(seconds)
+        peak_rss = max(peak_rss, rss)
+
+    seconds = statistics.median(timings)
+    return Measurement(
+        files=files,
+        mode=mode,
+        cache="cold" if cold else "warm",
+        seconds=round(seconds, 4),
+        files_audited=report["files"],
+        corpus_bytes=corpus,
+        bytes_scanned=report["bytes_scanned"],
+        mb_per_second=round(corpus / seconds / 1e6, 2),
+        files_per_second=round(report["files"] / seconds, 1),
+        peak_rss_mb=round(peak_rss, 1),
+    )
+
+
+def bench_size(workdir: str, count: int, args: argparse.Namespace) -> List[Measurement]:
+    """Generate one repository size and measure every configuration."""
+    root = os.path.join(workdir, f"repo-{count}")
+    sys.stderr.write(f"  generating {count} files...\n")
+    text_paths = generate_repo(root, count, args.density, args.seed)
+    staged = stage_edits(
+        root, text_paths, args.staged_fraction, args.density, args.seed
+    )
+    corpus = {
+        "all": corpus_size(root, text_paths),
+        "staged": corpus_size(root, staged),
+    }
+
+    results: List[Measurement] = []
+    for mode in ("all", "staged"):
+        for cold in (True, False):
+            result = measure(
+                root, count, mode, cold, corpus[mode], args.repeat, args.jobs
+            )
+            results.append(result)
+            write_row(result)
+    if not args.keep:
+        shutil.rmtree(root)
+    return results
+
+
+def environment() -> Dict[str, object]:
+    """Describe the host so saved results can be compared fairly."""
+    git_version = subprocess.run(
+        ["git", "--version"], capture_output=True, text=True, check=False
+    ).stdout.strip()
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "git": git_version,
+    }
+
+
+def write_header() -> None:
+    """Print the column header for result rows."""
+    sys.stdout.write("=" * TABLE_WIDTH + "\n")
+    sys.stdout.write(
+        f"  {'files':>7}  {'mode':<7}{'cache':<6}{'seconds':>9}{'MB/s':>9}"
+        f"{'scan MB':>10}{'files/s':>11}{'RSS MB':>9}{'delta':>9}\n"
+    )
+    sys.stdout.write("=" * TABLE_WIDTH + "\n")
+
+
+def write_row(result: Measurement, baseline: Optional[Measurement] = None) -> None:
+    """Print one measurement, with its change against a baseline if given."""
+    delta = ""
+    if baseline is not None and baseline.seconds:
+        delta = f"{(result.seconds / baseline.seconds - 1) * 100:+.1f}%"
+    sys.stdout.write(
+        f"  {result.files:>7}  {result.mode:<7}{result.cache:<6}"
+        f"{result.seconds:>9.3f}{result.mb_per_second:>9.2f}"
+        f"{result.bytes_scanned / 1e6:>10.2f}"
+        f"{result.files_per_second:>11.1f}{result.peak_rss_mb:>9.1f}{delta:>9}\n"
+    )
+
+
+def load_baseline(path: str) -> Dict[str, Measurement]:
+    """Read a previous --output file, keyed by configuration."""
+    with open(path, encoding="utf-8") as handle:
+        data = json.load(handle)
+    baseline = [Measurement(**entry) for entry in data["results"]]
+    return {entry.key: entry for entry in baseline}
+
+
+def main() -> None:
+    """Parse arguments, run the benchmark and report results."""
+    parser = argparse.ArgumentParser(description="Benchmark scripts/audit.py")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        metavar="N",
+        help="Repository sizes in files (default: 1000 10000 100000)",
+    )
+    parser.add_argument(
+        "--density",
+        type=float,
+        default=0.05,
+        help="Fraction of text files carrying a violation (default: 0.05)",
+    )
+    parser.add_argument(
+        "--staged-fraction",
+        type=float,
+        default=0.01,
+        help="Fraction of text files edited and staged (default: 0.01)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per configuration; the median is reported (default: 3)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Forwarded to audit.py --jobs (default: audit.py's own)",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Content seed")
+    parser.add_argument("--workdir", help="Where to build repositories")
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep generated repositories"
+    )
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--compare", help="Baseline JSON from a previous --output")
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    baseline = load_baseline(args.compare) if args.compare else {}
+    workdir = args.workdir or tempfile.mkdtemp(prefix="audit-bench-")
+    os.makedirs(workdir, exist_ok=True)
+
+    write_header()
+    results: List[Measurement] = []
+    for count in args.sizes:
+        results.extend(bench_size(workdir, count, args))
+    if not args.workdir and not args.keep:
+        shutil.rmtree(workdir)
+
+    if baseline:
+        sys.stdout.write("=" * TABLE_WIDTH + "\n")
+        sys.stdout.write("  COMPARED WITH BASELINE\n")
+        for result in results:
+            write_row(result, baseline.get(result.key))
+    sys.stdout.write("=" * TABLE_WIDTH + "\n")
+
+    if args.output:
+        payload = {
+            "environment": environment(),
+            "settings": {
+                "density": args.density,
+                "staged_fraction": args.staged_fraction,
+                "repeat": args.repeat,
+                "jobs": args.jobs,
+                "seed": args.seed,
+            },
+            "results": [asdict(result) for result in results],
+        }
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
+            handle.write("\n")
+
+
+if __name__ == "__main__":
+    main()
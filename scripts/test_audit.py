@@ -0,0 +1,172 @@
+"""Tests for the Swift token rules and block scanning in audit.py.
+
+Run with:
+  python3 -m unittest discover scripts
+"""
+
+import unittest
+from typing import Dict, List
+from unittest import mock
+
+import audit
+
+
+def line_hits(data: bytes, path: str, block_size: int) -> Dict[str, List[int]]:
+    """Return the line numbers each rule flags when ``data`` arrives in blocks."""
+    blocks = iter([data[i : i + block_size] for i in range(0, len(data), block_size)])
+    scan = audit.scan_blocks(blocks, audit.rules_for(path), len(data))
+    return {
+        check_id: sorted(line_no for line_no, _ in found)
+        for check_id, found in scan.hits.items()
+    }
+
+
+def token_hits(source: str) -> Dict[str, List[int]]:
+    """Return the line numbers each token rule flags in a Swift snippet."""
+    data = source.encode()
+    rules = [rule for rule in audit.rules_for("View.swift") if not rule.pattern]
+    scan = audit.scan_blocks(iter([data]), rules, len(data))
+    return {
+        check_id: [line_no for line_no, _ in found]
+        for check_id, found in scan.hits.items()
+    }
+
+
+class ForceUnwrapTest(unittest.TestCase):
+    """FU-001 flags postfix ``!`` on an operand and nothing else."""
+
+    def test_postfix_operands(self) -> None:
+        source = (
+            "let a = arr.first!\n"
+            "let b = xs.map { $0! }\n"
+            "let c = pair.0!\n"
+            "let d = load()!\n"
+            "let e = items[0]!\n"
+            "let f = $value!\n"
+        )
+        self.assertEqual(token_hits(source), {"FU-001": [1, 2, 3, 4, 5, 6]})
+
+    def test_forced_try_and_cast(self) -> None:
+        source = "let a = try! load()\nlet b = y as! Int\n"
+        self.assertEqual(token_hits(source), {"FU-001": [1, 2]})
+
+    def test_not_equal_and_prefix_not(self) -> None:
+        source = (
+            "let a = lhs != rhs\n"
+            "if !done { }\n"
+            "func f() -> Bool { return!x }\n"
+            "let b = !flag\n"
+            "let c = 1.0\n"
+        )
+        self.assertEqual(token_hits(source), {})
+
+    def test_waiver(self) -> None:
+        source = "let a = view.layer!  // APPLE-API-REQUIRED\n"
+        self.assertEqual(token_hits(source), {})
+
+
+class DebugArtifactTest(unittest.TestCase):
+    """DA-001 flags free debug calls outside ``#if DEBUG`` branches."""
+
+    def test_debug_branches(self) -> None:
+        source = (
+            "#if DEBUG\n"
+            'print("a")\n'
+            "#elseif TESTING\n"
+            'print("b")\n'
+            "#else\n"
+            'print("c")\n'
+            "#endif\n"
+            'dump("d")\n'
+        )
+        self.assertEqual(token_hits(source), {"DA-001": [4, 6, 8]})
+
+    def test_qualified_and_member_calls(self) -> None:
+        source = 'Swift.print("a")\nlogger.print("b")\nfunc print(_ s: String) {}\n'
+        self.assertEqual(token_hits(source), {"DA-001": [1]})
+
+
+class CombineTest(unittest.TestCase):
+    """CB-001 flags imports of Combine in any form."""
+
+    def test_imports(self) -> None:
+        source = (
+            "import Combine\n"
+            "import struct Combine.AnyPublisher\n"
+            "import SwiftUI\n"
+            "let Combine = 1\n"
+            "// import Combine\n"
+        )
+        self.assertEqual(token_hits(source), {"CB-001": [1, 2]})
+
+
+class LexerContextTest(unittest.TestCase):
+    """Comments and string contents never produce token hits."""
+
+    def test_comments(self) -> None:
+        source = (
+            "// let a = b!\n"
+            "/* outer /* inner */ still comment x!\n"
+            'print("a") */\n'
+            "let c = d!\n"
+        )
+        self.assertEqual(token_hits(source), {"FU-001": [4]})
+
+    def test_raw_strings(self) -> None:
+        source = (
+            'let a = #"say "x!" \\(y!)"#\n'
+            'let b = #"\\#(z!)"#\n'
+            'let c = ##"print("a") "# x!"##\n'
+        )
+        self.assertEqual(token_hits(source), {"FU-001": [2]})
+
+    def test_multiline_strings(self) -> None:
+        source = 'let a = """\n  x!\n  print("a")\n  """\nlet b = c!\n'
+        self.assertEqual(token_hits(source), {"FU-001": [5]})
+
+    def test_interpolation(self) -> None:
+        source = (
+            'let a = "value \\(opt!) and \\(f("x!"))"\n'
+            'let b = """\n'
+            "  \\(print(1))\n"
+            '  """\n'
+        )
+        self.assertEqual(token_hits(source), {"FU-001": [1], "DA-001": [3]})
+
+
+WEBHOOK = "https://discord" + ".com/api/webhooks/1"
+
+
+@mock.patch.object(audit, "MAX_CARRY_BYTES", 64)
+@mock.patch.object(audit, "MAX_MATCH_BYTES", 48)
+@mock.patch.object(audit, "MAX_PENDING_TOKENS", 3)
+class BlockSplitTest(unittest.TestCase):
+    """Cutting long lines, comments and strings never changes the hits."""
+
+    def assert_split_invariant(self, source: str, path: str) -> None:
+        data = source.encode()
+        whole = line_hits(data, path, len(data))
+        self.assertTrue(whole)
+        for block_size in (1, 2, 3, 7, 16, 61, 200):
+            self.assertEqual(line_hits(data, path, block_size), whole, block_size)
+
+    def test_long_swift_line(self) -> None:
+        source = "let a = b! " * 40 + f'DispatchQueue.main "{WEBHOOK}" c!\nprint(1)\n'
+        self.assert_split_invariant(source, "View.swift")
+
+    def test_unterminated_comment_and_string(self) -> None:
+        source = (
+            "/* a /* b */ x! " + "y " * 60 + "*/ z!\n"
+            'let s = """\n' + "q! \\(w!) " * 20 + '\n"""\n'
+            'let r = ##"' + 'k! \\##(m!) "# ' * 10 + '"##\n'
+            "/* " + "x! " * 60
+        )
+        self.assert_split_invariant(source, "View.swift")
+
+    def test_long_line_without_newline(self) -> None:
+        source = '{"k": "' + "abcdefgh" * 40 + WEBHOOK + '", "v": "' + WEBHOOK + '"}'
+        self.assert_split_invariant(source, "data.json")
+
+
+if __name__ == "__main__":
+    unittest.main()